@@ -528,6 +528,7 @@ program
   .option('-u, --user <name>', 'User type to scaffold')
   .option('--all', 'Scaffold all epics and user types', false)
   .option('--list', 'List available epics and user types', false)
+  .option('-v, --verbose', 'List every created file', false)
   .action(options => {
     if (options.list) {
       console.log('Available Epics and User Types:\n');
@@ -563,8 +564,10 @@ program
     }
 
     console.log(`Created: ${result.created.length} files`);
-    for (const file of result.created) {
-      console.log(`  ✓ ${file}`);
+    if (options.verbose) {
+      for (const file of result.created) {
+        console.log(`  ✓ ${file}`);
+      }
     }
 
     console.log(`\nSkipped: ${result.skipped.length} files (already exist)`);
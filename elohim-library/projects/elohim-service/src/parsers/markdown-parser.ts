@@ -12,6 +12,23 @@ import * as yaml from 'js-yaml';
 import { ParsedContent, ParsedSection } from '../models/import-context.model';
 import { PathMetadata } from '../models/path-metadata.model';
 
+/**
+ * Line patterns, hoisted so per-line loops reuse one RegExp instead of
+ * allocating a new one on every iteration
+ */
+const H1_PATTERN = /^#\s+(.+)$/;
+const H2_PATTERN = /^##\s+(.+)$/;
+const HEADING_PATTERN = /^(#{1,6})\s+(.+)$/;
+const BOLD_MARKER_PATTERN = /\*\*/g;
+
+/**
+ * Anchor slug patterns: whitespace and dash runs collapse to one dash in a
+ * single pass
+ */
+const ANCHOR_STRIP_PATTERN = /[^a-z0-9\s-]/g;
+const ANCHOR_SEPARATOR_PATTERN = /[\s-]+/g;
+const ANCHOR_EDGE_PATTERN = /^-|-$/g;
+
 /**
  * Parse a markdown file
  */
@@ -105,19 +122,21 @@ function extractTitle(
     return frontmatter.archetype_name;
   }
 
-  // Priority 3: First H1 heading
+  // Priority 3: First H1 heading (only lines starting with '#' can match)
   for (const line of lines) {
-    const h1Match = /^#\s+(.+)$/.exec(line);
+    if (!line.startsWith('#')) continue;
+    const h1Match = H1_PATTERN.exec(line);
     if (h1Match) {
-      return h1Match[1].trim().replace(/\*\*/g, '');
+      return h1Match[1].trim().replace(BOLD_MARKER_PATTERN, '');
     }
   }
 
   // Priority 4: First H2 heading
   for (const line of lines) {
-    const h2Match = /^##\s+(.+)$/.exec(line);
+    if (!line.startsWith('#')) continue;
+    const h2Match = H2_PATTERN.exec(line);
     if (h2Match) {
-      return h2Match[1].trim().replace(/\*\*/g, '');
+      return h2Match[1].trim().replace(BOLD_MARKER_PATTERN, '');
     }
   }
 
@@ -187,14 +206,26 @@ function formatBaseName(baseName: string): string {
 function extractSections(lines: string[]): ParsedSection[] {
   const sections: ParsedSection[] = [];
   let currentSection: ParsedSection | null = null;
+  let contentStart = 0;
   const sectionStack: ParsedSection[] = [];
 
-  for (const line of lines) {
-    const headingMatch = /^(#{1,6})\s+(.+)$/.exec(line);
+  // Join a section's body lines once, when the next heading (or the end of
+  // the file) closes it, rather than appending to its content line by line
+  const closeSection = (end: number): void => {
+    if (currentSection && end > contentStart) {
+      currentSection.content = lines.slice(contentStart, end).join('\n') + '\n';
+    }
+  };
+
+  for (let i = 0; i < lines.length; i++) {
+    // Most lines are body text; only run the heading regex on '#' lines
+    const headingMatch = lines[i].startsWith('#') ? HEADING_PATTERN.exec(lines[i]) : null;
 
     if (headingMatch) {
+      closeSection(i);
+
       const level = headingMatch[1].length;
-      const title = headingMatch[2].trim().replace(/\*\*/g, '');
+      const title = headingMatch[2].trim().replace(BOLD_MARKER_PATTERN, '');
       const anchor = generateAnchor(title);
 
       const newSection: ParsedSection = {
@@ -220,12 +251,12 @@ function extractSections(lines: string[]): ParsedSection[] {
 
       sectionStack.push(newSection);
       currentSection = newSection;
-    } else if (currentSection) {
-      // Add content to current section
-      currentSection.content += line + '\n';
+      contentStart = i + 1;
     }
   }
 
+  closeSection(lines.length);
+
   return sections;
 }
 
@@ -235,10 +266,9 @@ function extractSections(lines: string[]): ParsedSection[] {
 function generateAnchor(text: string): string {
   return text
     .toLowerCase()
-    .replace(/[^a-z0-9\s-]/g, '')
-    .replace(/\s+/g, '-')
-    .replace(/-+/g, '-')
-    .replace(/^-|-$/g, '');
+    .replace(ANCHOR_STRIP_PATTERN, '')
+    .replace(ANCHOR_SEPARATOR_PATTERN, '-')
+    .replace(ANCHOR_EDGE_PATTERN, '');
 }
 
 /**
@@ -258,7 +288,8 @@ export function extractDescription(parsed: ParsedContent, maxLength = 300): stri
   // Priority 3: First paragraph of first section
   if (parsed.sections && parsed.sections.length > 0) {
     const firstContent = parsed.sections[0].content.trim();
-    const firstParagraph = firstContent.split(/\n\n/)[0];
+    const paragraphEnd = firstContent.indexOf('\n\n');
+    const firstParagraph = paragraphEnd === -1 ? firstContent : firstContent.slice(0, paragraphEnd);
     if (firstParagraph) {
       return truncate(firstParagraph.replace(/\n/g, ' '), maxLength);
     }
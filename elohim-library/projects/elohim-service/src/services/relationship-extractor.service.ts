@@ -53,6 +53,20 @@ const DEFAULT_OPTIONS: RelationshipExtractionOptions = {
   maxPerNode: 10, // Fewer relationships per node
 };
 
+/**
+ * Tags too generic to indicate a meaningful relationship
+ */
+const COMMON_TAGS: ReadonlySet<string> = new Set([
+  'source',
+  'resource',
+  'scenario',
+  'epic',
+  'role',
+  'archetype',
+  'feature',
+  'documentation',
+]);
+
 let relationshipIdCounter = 0;
 
 function generateRelationshipId(): string {
@@ -238,20 +252,8 @@ function extractTagRelationships(
   const nodeTags = new Set(node.tags || []);
   if (nodeTags.size === 0) return relationships;
 
-  // Skip common tags that don't indicate meaningful relationships
-  const commonTags = new Set([
-    'source',
-    'resource',
-    'scenario',
-    'epic',
-    'role',
-    'archetype',
-    'feature',
-    'documentation',
-  ]);
-
   // Pre-calculate meaningful tags once
-  const meaningfulNodeTags = [...nodeTags].filter(t => !commonTags.has(t));
+  const meaningfulNodeTags = [...nodeTags].filter(t => !COMMON_TAGS.has(t));
   if (meaningfulNodeTags.length === 0) return relationships;
 
   for (const [otherId, other] of nodeMap) {
@@ -260,19 +262,19 @@ function extractTagRelationships(
     // Skip source nodes
     if (other.contentType === 'source') continue;
 
-    const otherTags = new Set(other.tags || []);
-    if (otherTags.size === 0) continue;
+    if (!other.tags || other.tags.length === 0) continue;
 
-    const meaningfulOtherTags = [...otherTags].filter(t => !commonTags.has(t));
-    if (meaningfulOtherTags.length === 0) continue;
+    const meaningfulOtherTags = new Set(other.tags.filter(t => !COMMON_TAGS.has(t)));
+    if (meaningfulOtherTags.size === 0) continue;
 
-    const intersection = meaningfulNodeTags.filter(t => meaningfulOtherTags.includes(t));
+    const intersection = meaningfulNodeTags.filter(t => meaningfulOtherTags.has(t));
 
     // Require at least 2 shared meaningful tags
     if (intersection.length < 2) continue;
 
-    const union = new Set([...meaningfulNodeTags, ...meaningfulOtherTags]);
-    const similarity = intersection.length / union.size;
+    // Both tag lists are distinct, so the union size follows from the overlap
+    const unionSize = meaningfulNodeTags.length + meaningfulOtherTags.size - intersection.length;
+    const similarity = intersection.length / unionSize;
 
     // Higher threshold (0.5 instead of 0.3)
     if (similarity >= 0.5) {
@@ -145,6 +145,20 @@ describe('Scaffold Service', () => {
       expect(result.skipped).toHaveLength(2);
     });
 
+    it('should never overwrite a differently cased existing file', () => {
+      const userPath = path.join(tempDir, 'value_scanner', 'adult');
+      const notesPath = path.join(userPath, 'readme.md');
+      fs.mkdirSync(userPath, { recursive: true });
+      fs.writeFileSync(notesPath, 'my notes', 'utf-8');
+      // On case-insensitive filesystems (macOS/Windows defaults) this is README.md
+      const foldsCase = fs.existsSync(path.join(userPath, 'README.md'));
+
+      const result = scaffoldUserType(tempDir, 'value_scanner', 'adult');
+
+      expect(result.skipped.includes(path.join(userPath, 'README.md'))).toBe(foldsCase);
+      expect(fs.readFileSync(notesPath, 'utf-8')).toBe('my notes');
+    });
+
     it('should return error for unknown epic', () => {
       const result = scaffoldUserType(tempDir, 'unknown_epic', 'user');
 
@@ -175,6 +189,16 @@ describe('Scaffold Service', () => {
       expect(result.errors).toHaveLength(0);
     });
 
+    it('should only skip files that already exist for a user', () => {
+      scaffoldUserType(tempDir, 'governance', 'researcher');
+      fs.unlinkSync(path.join(tempDir, 'governance', 'researcher', 'TODO.md'));
+
+      const result = scaffoldEpic(tempDir, 'governance');
+
+      expect(result.skipped).toEqual([path.join(tempDir, 'governance', 'researcher', 'README.md')]);
+      expect(result.created).toHaveLength(EPICS['governance'].users.length * 2 - 1);
+    });
+
     it('should create directories for all users', () => {
       scaffoldEpic(tempDir, 'public_observer');
 
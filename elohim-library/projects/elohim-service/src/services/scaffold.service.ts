@@ -214,6 +214,18 @@ related_users: [TO_BE_DEFINED]
 `;
 }
 
+/**
+ * Scenario checklists depend only on the layer lists, so they are built once
+ * rather than for every TODO.md
+ */
+const GEOGRAPHIC_CHECKLIST = GEOGRAPHIC_LAYERS.map(
+  layer => `- [ ] \`scenarios/${layer}.md\` - ${formatUserType(layer)} level scenarios`
+).join('\n');
+
+const FUNCTIONAL_CHECKLIST = FUNCTIONAL_LAYERS.map(
+  layer => `- [ ] \`scenarios/${layer}.md\` - ${formatUserType(layer)} scenarios`
+).join('\n');
+
 /**
  * Generate TODO.md template for scenario planning
  */
@@ -221,14 +233,6 @@ export function generateTodo(epic: string, userType: string): string {
   const userDisplay = formatUserType(userType);
   const epicDisplay = formatEpic(epic);
 
-  const geographicChecklist = GEOGRAPHIC_LAYERS.map(
-    layer => `- [ ] \`scenarios/${layer}.md\` - ${formatUserType(layer)} level scenarios`
-  ).join('\n');
-
-  const functionalChecklist = FUNCTIONAL_LAYERS.map(
-    layer => `- [ ] \`scenarios/${layer}.md\` - ${formatUserType(layer)} scenarios`
-  ).join('\n');
-
   return `# Scenarios TODO - ${userDisplay} (${epicDisplay})
 
 ## Overview
@@ -248,13 +252,13 @@ This file tracks which scenario files need to be created for the \`${userType}\`
 
 [**TODO**: Check which of these layers are relevant for ${userType}, then create scenario files accordingly]
 
-${geographicChecklist}
+${GEOGRAPHIC_CHECKLIST}
 
 ### Functional Layers
 
 [**TODO**: Check which of these functional domains are relevant for ${userType}]
 
-${functionalChecklist}
+${FUNCTIONAL_CHECKLIST}
 
 ## Scenario File Format
 
@@ -346,29 +350,28 @@ export function scaffoldUserType(basePath: string, epic: string, userType: strin
 
   const userPath = path.join(basePath, epic, userType);
 
-  // Ensure directory exists
-  if (!fs.existsSync(userPath)) {
-    fs.mkdirSync(userPath, { recursive: true });
-  }
-
-  // Generate README.md
-  const readmePath = path.join(userPath, 'README.md');
-  if (fs.existsSync(readmePath)) {
-    result.skipped.push(readmePath);
-  } else {
-    const readme = generateReadme(epic, userType, epicConfig.description);
-    fs.writeFileSync(readmePath, readme, 'utf-8');
-    result.created.push(readmePath);
-  }
-
-  // Generate TODO.md
-  const todoPath = path.join(userPath, 'TODO.md');
-  if (fs.existsSync(todoPath)) {
-    result.skipped.push(todoPath);
-  } else {
-    const todo = generateTodo(epic, userType);
-    fs.writeFileSync(todoPath, todo, 'utf-8');
-    result.created.push(todoPath);
+  // Ensure directory exists (a no-op when it already does)
+  fs.mkdirSync(userPath, { recursive: true });
+
+  const templates: [string, string][] = [
+    ['README.md', generateReadme(epic, userType, epicConfig.description)],
+    ['TODO.md', generateTodo(epic, userType)],
+  ];
+
+  // Exclusive create lets the filesystem decide whether a template exists,
+  // with no stat per file and no case-sensitive name comparison: an existing
+  // readme.md on a case-insensitive filesystem is skipped, not truncated
+  for (const [fileName, content] of templates) {
+    const filePath = path.join(userPath, fileName);
+    try {
+      fs.writeFileSync(filePath, content, { encoding: 'utf-8', flag: 'wx' });
+      result.created.push(filePath);
+    } catch (err) {
+      if ((err as NodeJS.ErrnoException).code !== 'EEXIST') {
+        throw err;
+      }
+      result.skipped.push(filePath);
+    }
   }
 
   return result;
@@ -9,72 +9,83 @@
  * - Git-based timestamps
  */
 
-import { execSync } from 'child_process';
+import { execFileSync, ExecFileSyncOptionsWithStringEncoding } from 'child_process';
 import * as fs from 'fs';
+import * as path from 'path';
 
 import { ContentNode } from '../models/content-node.model';
 
 /**
  * ActivityPub type mapping from ContentType
+ *
+ * Read-only Maps rather than object literals, so lookups cannot be mutated at
+ * runtime or fall through to Object.prototype keys such as 'constructor'.
  */
-const ACTIVITYPUB_TYPE_MAP: Record<string, string> = {
-  epic: 'Article',
-  feature: 'Article',
-  scenario: 'Note',
-  video: 'Video',
-  book: 'Document',
-  'book-chapter': 'Document',
-  'bible-verse': 'Note',
-  'course-module': 'Article',
-  simulation: 'Application',
-  assessment: 'Question',
-  concept: 'Page',
-  organization: 'Organization',
-  podcast: 'AudioObject',
-  article: 'Article',
-  source: 'Document',
-  role: 'Page',
-  reference: 'Document',
-  example: 'Note',
-};
+const ACTIVITYPUB_TYPE_MAP: ReadonlyMap<string, string> = new Map([
+  ['epic', 'Article'],
+  ['feature', 'Article'],
+  ['scenario', 'Note'],
+  ['video', 'Video'],
+  ['book', 'Document'],
+  ['book-chapter', 'Document'],
+  ['bible-verse', 'Note'],
+  ['course-module', 'Article'],
+  ['simulation', 'Application'],
+  ['assessment', 'Question'],
+  ['concept', 'Page'],
+  ['organization', 'Organization'],
+  ['podcast', 'AudioObject'],
+  ['article', 'Article'],
+  ['source', 'Document'],
+  ['role', 'Page'],
+  ['reference', 'Document'],
+  ['example', 'Note'],
+]);
 
 /**
  * Schema.org type mapping from ContentType
  */
-const SCHEMA_TYPE_MAP: Record<string, string> = {
-  epic: 'Article',
-  feature: 'Article',
-  video: 'VideoObject',
-  book: 'Book',
-  'book-chapter': 'Chapter',
-  organization: 'Organization',
-  assessment: 'Quiz',
-  'course-module': 'LearningResource',
-  'bible-verse': 'CreativeWork',
-  podcast: 'PodcastEpisode',
-  article: 'Article',
-  source: 'CreativeWork',
-  scenario: 'HowTo',
-  role: 'JobPosting',
-  concept: 'DefinedTerm',
-  reference: 'Article',
-  example: 'CreativeWork',
-};
+const SCHEMA_TYPE_MAP: ReadonlyMap<string, string> = new Map([
+  ['epic', 'Article'],
+  ['feature', 'Article'],
+  ['video', 'VideoObject'],
+  ['book', 'Book'],
+  ['book-chapter', 'Chapter'],
+  ['organization', 'Organization'],
+  ['assessment', 'Quiz'],
+  ['course-module', 'LearningResource'],
+  ['bible-verse', 'CreativeWork'],
+  ['podcast', 'PodcastEpisode'],
+  ['article', 'Article'],
+  ['source', 'CreativeWork'],
+  ['scenario', 'HowTo'],
+  ['role', 'JobPosting'],
+  ['concept', 'DefinedTerm'],
+  ['reference', 'Article'],
+  ['example', 'CreativeWork'],
+]);
+
+/**
+ * Patterns used by generateDid, compiled once for every node
+ */
+const DID_SUFFIX_PATTERN = /(?:\.feature)?(?:\.md)?$/;
+const DID_SEPARATOR_PATTERN = /[/_]/g;
+const DID_SEPARATOR_MAP: Record<string, string> = { '/': ':', _: '-' };
+const DASH_RUN_PATTERN = /-+/g;
+const EDGE_SEPARATOR_PATTERN = /^[:-]+|[:-]+$/g;
 
 /**
  * Generate W3C Decentralized Identifier from source path
  */
 export function generateDid(sourcePath: string, nodeType = 'content'): string {
-  // Clean and normalize the path
+  // Strip extensions, then map '/' -> ':' and '_' -> '-' in a single pass
   let pathPart = sourcePath
-    .replace(/\.md$/, '')
-    .replace(/\.feature$/, '')
-    .replace(/\//g, ':')
-    .replace(/_/g, '-')
+    .replace(DID_SUFFIX_PATTERN, '')
+    .replace(DID_SEPARATOR_PATTERN, c => DID_SEPARATOR_MAP[c])
     .toLowerCase();
 
   // Remove leading/trailing separators and collapse multiple dashes
-  pathPart = pathPart.replace(/-+/g, '-').replace(/^[:-]+|[:-]+$/g, '');
+  pathPart = pathPart.replace(DASH_RUN_PATTERN, '-').replace(EDGE_SEPARATOR_PATTERN, '');
 
   return `did:web:elohim.host:${nodeType}:${pathPart}`;
 }
@@ -83,43 +94,232 @@ export function generateDid(sourcePath: string, nodeType = 'content'): string {
  * Infer ActivityPub type from ContentType
  */
 export function inferActivityPubType(contentType: string): string {
-  return ACTIVITYPUB_TYPE_MAP[contentType] || 'Page';
+  return ACTIVITYPUB_TYPE_MAP.get(contentType) ?? 'Page';
 }
 
 /**
- * Get timestamps from git history for a file
+ * Created/modified timestamps for a file
+ */
+export interface GitTimestamps {
+  created: string;
+  modified: string;
+}
+
+/**
+ * Walks are scoped to a directory, so output stays proportional to that
+ * directory's history. A directory whose log still exceeds the buffer falls
+ * back to walking each requested file on its own.
  */
-export function getGitTimestamps(filePath: string): { created: string; modified: string } {
-  const now = new Date().toISOString();
+const GIT_EXEC_OPTIONS: ExecFileSyncOptionsWithStringEncoding = {
+  encoding: 'utf-8',
+  stdio: ['pipe', 'pipe', 'ignore'],
+  maxBuffer: 64 * 1024 * 1024,
+};
+
+/**
+ * Name-status letters of a path added in a commit (one letter per merge parent)
+ */
+const ADDED_STATUS_PATTERN = /^A+$/;
+
+/**
+ * Repository root per directory (null when the directory is not in a work tree)
+ */
+const gitRootCache = new Map<string, string | null>();
+
+/**
+ * Timestamps for every path under a walked directory, keyed by repository root
+ * and then by directory relative to it ('.' for the root). Null marks a
+ * directory whose history was too large to read in one walk.
+ */
+const gitHistoryCache = new Map<string, Map<string, Map<string, GitTimestamps> | null>>();
+
+/**
+ * Resolve the git work tree containing a directory by looking for a `.git`
+ * entry in it or its ancestors. Checkouts without one (CI scratch dirs,
+ * unpacked archives) never spawn git at all.
+ */
+function resolveGitRoot(dir: string): string | null {
+  const cached = gitRootCache.get(dir);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const visited: string[] = [];
+  let root: string | null = null;
+  for (let current = dir; ; current = path.dirname(current)) {
+    const known = gitRootCache.get(current);
+    if (known !== undefined) {
+      root = known;
+      break;
+    }
+    visited.push(current);
+    // .git is a directory in a normal clone and a file in worktrees/submodules
+    if (fs.existsSync(path.join(current, '.git'))) {
+      root = current;
+      break;
+    }
+    if (path.dirname(current) === current) {
+      break;
+    }
+  }
+
+  for (const visitedDir of visited) {
+    gitRootCache.set(visitedDir, root);
+  }
+  return root;
+}
+
+/**
+ * Walk the history under a pathspec once, recording for every path the date
+ * of its most recent addition and of its most recent change.
+ *
+ * `--cc` lists a path on a merge commit when the merge result differs from
+ * every parent, so conflict resolutions count as changes.
+ *
+ * History simplification follows the pathspec rather than each file, so this
+ * is not always `git log -- <file>`: when a directory walk keeps a merge's
+ * side branch because the merge took something else from it, a side-branch
+ * edit to a file whose version the merge discarded still counts as that
+ * file's latest change.
+ */
+function walkGitHistory(root: string, pathspec: string): Map<string, GitTimestamps> {
+  // Commits arrive newest first, each prefixed with a record separator
+  const log = execFileSync(
+    'git',
+    [
+      '--literal-pathspecs',
+      'log',
+      '-z',
+      '--cc',
+      '--no-renames',
+      '--name-status',
+      '--format=%x1e%aI',
+      '--',
+      pathspec,
+    ],
+    { ...GIT_EXEC_OPTIONS, cwd: root }
+  );
+
+  const history = new Map<string, GitTimestamps>();
+  for (const commit of log.split('\x1e')) {
+    // -z leaves paths unquoted: the date, then NUL-separated status/path pairs.
+    // A merge's pairs follow an empty field, a commit's start on a new line.
+    const fields = commit.split('\0');
+    const date = fields[0];
+    for (let i = fields[1] === '' ? 2 : 1; i + 1 < fields.length; i += 2) {
+      const file = fields[i + 1];
+      let entry = history.get(file);
+      if (!entry) {
+        entry = { created: '', modified: date };
+        history.set(file, entry);
+      }
+      if (!entry.created && ADDED_STATUS_PATTERN.test(fields[i].trim())) {
+        entry.created = date;
+      }
+    }
+  }
+  return history;
+}
+
+/**
+ * History for every path under a directory, reusing a walk of the directory
+ * or any ancestor already read. Returns null when the directory's history is
+ * too large to read in one walk.
+ */
+function loadDirectoryHistory(
+  root: string,
+  relativeDir: string
+): Map<string, GitTimestamps> | null {
+  let walks = gitHistoryCache.get(root);
+  if (!walks) {
+    walks = new Map();
+    gitHistoryCache.set(root, walks);
+  }
+
+  for (let dir = relativeDir; ; dir = path.posix.dirname(dir)) {
+    const cached = walks.get(dir);
+    if (cached) {
+      return cached;
+    }
+    if (dir === '.') {
+      break;
+    }
+  }
+  if (walks.has(relativeDir)) {
+    return null;
+  }
 
   try {
-    // Get first commit (creation date)
-    const createdRaw = execSync(`git log --diff-filter=A --format=%aI -- "${filePath}"`, {
-      encoding: 'utf-8',
-      stdio: ['pipe', 'pipe', 'ignore'],
-    })
-      .trim()
-      .split('\n')[0];
-
-    // Get last commit (modification date)
-    const modifiedRaw = execSync(`git log -1 --format=%aI -- "${filePath}"`, {
-      encoding: 'utf-8',
-      stdio: ['pipe', 'pipe', 'ignore'],
-    }).trim();
-
-    return {
-      created: createdRaw || now,
-      modified: modifiedRaw || now,
-    };
+    const history = walkGitHistory(root, relativeDir);
+    walks.set(relativeDir, history);
+    return history;
+  } catch {
+    walks.set(relativeDir, null);
+    return null;
+  }
+}
+
+/**
+ * Look up a file in its repository's history.
+ * Returns null when the file is not inside a git work tree.
+ */
+function lookupGitTimestamps(filePath: string): GitTimestamps | null {
+  const absolutePath = path.resolve(filePath);
+  let dir: string;
+  try {
+    dir = fs.realpathSync(path.dirname(absolutePath));
   } catch {
-    // Fallback to file system timestamps
-    try {
-      const stats = fs.statSync(filePath);
-      const mtime = stats.mtime.toISOString();
-      return { created: mtime, modified: mtime };
-    } catch {
-      return { created: now, modified: now };
+    return null;
+  }
+
+  const root = resolveGitRoot(dir);
+  if (!root) {
+    return null;
+  }
+
+  const relativeDir = path.relative(root, dir).split(path.sep).join('/') || '.';
+  const relativePath = path.posix.join(relativeDir, path.basename(absolutePath));
+  const history = loadDirectoryHistory(root, relativeDir) ?? walkGitHistory(root, relativePath);
+  return history.get(relativePath) ?? { created: '', modified: '' };
+}
+
+/**
+ * Forget cached git history, e.g. after new commits in a long-running process
+ */
+export function clearGitTimestampCache(): void {
+  gitRootCache.clear();
+  gitHistoryCache.clear();
+}
+
+/**
+ * Get timestamps from git history for a file
+ */
+export function getGitTimestamps(filePath: string): GitTimestamps {
+  try {
+    const timestamps = lookupGitTimestamps(filePath);
+    if (timestamps) {
+      if (timestamps.created && timestamps.modified) {
+        return { created: timestamps.created, modified: timestamps.modified };
+      }
+
+      // Only format the current time when git has no history for the file
+      const now = new Date().toISOString();
+      return {
+        created: timestamps.created || now,
+        modified: timestamps.modified || now,
+      };
     }
+  } catch {
+    // Fall through to file system timestamps
+  }
+
+  try {
+    const stats = fs.statSync(filePath);
+    const mtime = stats.mtime.toISOString();
+    return { created: mtime, modified: mtime };
+  } catch {
+    const now = new Date().toISOString();
+    return { created: now, modified: now };
   }
 }
 
@@ -139,6 +339,18 @@ export interface OpenGraphMetadata {
   articleSection?: string;
 }
 
+/**
+ * Content types published as Open Graph articles
+ */
+const ARTICLE_CONTENT_TYPES: ReadonlySet<string> = new Set([
+  'epic',
+  'feature',
+  'scenario',
+  'concept',
+  'course-module',
+  'article',
+]);
+
 /**
  * Generate Open Graph metadata for a content node
  */
@@ -150,25 +362,18 @@ export function generateOpenGraphMetadata(
   metadata: Record<string, unknown> = {},
   timestamps: { created: string; modified: string } = { created: '', modified: '' }
 ): OpenGraphMetadata {
-  const articleTypes = new Set([
-    'epic',
-    'feature',
-    'scenario',
-    'concept',
-    'course-module',
-    'article',
-  ]);
+  const isArticle = ARTICLE_CONTENT_TYPES.has(contentType);
 
   const og: OpenGraphMetadata = {
     ogTitle: title,
     ogDescription: (description || title).substring(0, 200),
-    ogType: articleTypes.has(contentType) ? 'article' : 'website',
+    ogType: isArticle ? 'article' : 'website',
     ogUrl: `https://elohim-protocol.org/content/${nodeId}`,
     ogSiteName: 'Elohim Protocol - Lamad Learning Platform',
   };
 
   // Add timestamps for articles
-  if (articleTypes.has(contentType)) {
+  if (isArticle) {
     og.articlePublishedTime = timestamps.created;
     og.articleModifiedTime = timestamps.modified;
     if (metadata.epic) {
@@ -210,6 +415,15 @@ export interface LinkedData {
   };
 }
 
+/**
+ * Publisher shared by every node's JSON-LD (frozen, since it is shared)
+ */
+const PUBLISHER: LinkedData['publisher'] = Object.freeze({
+  '@type': 'Organization',
+  '@id': 'https://elohim-protocol.org',
+  name: 'Elohim Protocol',
+});
+
 /**
  * Generate JSON-LD for semantic web compliance
  */
@@ -222,7 +436,7 @@ export function generateLinkedData(
   timestamps: { created: string; modified: string },
   metadata: Record<string, unknown> = {}
 ): LinkedData {
-  const schemaType = SCHEMA_TYPE_MAP[contentType] || 'CreativeWork';
+  const schemaType = SCHEMA_TYPE_MAP.get(contentType) ?? 'CreativeWork';
 
   const linkedData: LinkedData = {
     '@context': 'https://schema.org/',
@@ -233,11 +447,7 @@ export function generateLinkedData(
     description: description || title,
     dateCreated: timestamps.created,
     dateModified: timestamps.modified,
-    publisher: {
-      '@type': 'Organization',
-      '@id': 'https://elohim-protocol.org',
-      name: 'Elohim Protocol',
-    },
+    publisher: PUBLISHER,
   };
 
   // Add author if available
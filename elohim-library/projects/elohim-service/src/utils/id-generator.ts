@@ -2,6 +2,9 @@
  * Utility functions for generating and normalizing IDs
  */
 
+const NON_ALPHANUMERIC_RUN_PATTERN = /[^a-z0-9]+/g;
+const EDGE_DASH_PATTERN = /^-|-$/g;
+
 /**
  * Normalizes an array of strings into a kebab-case ID
  * @param parts - Array of string parts to normalize
@@ -11,9 +14,10 @@
  * normalizeId(['user_profile', 'ADMIN']) // returns 'user-profile-admin'
  */
 export function normalizeId(parts: string[]): string {
+  // Join first so lowercasing and separator collapsing run once over the whole ID
   return parts
-    .map(p => p.toLowerCase().replace(/[^a-z0-9]/g, '-'))
     .join('-')
-    .replace(/-+/g, '-')
-    .replace(/^-|-$/g, '');
+    .toLowerCase()
+    .replace(NON_ALPHANUMERIC_RUN_PATTERN, '-')
+    .replace(EDGE_DASH_PATTERN, '');
 }